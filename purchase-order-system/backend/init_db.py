@@ -17,40 +17,35 @@ def init_database():
             order_date=date(2025, 1, 5),
             delivery_date=date(2025, 1, 15),
             quantity=10,
-            unit_price=1200.00,
-            total_price=12000.00
+            unit_price=1200.00
         ),
         PurchaseOrder(
             item_name="Office Chair",
             order_date=date(2025, 1, 8),
             delivery_date=date(2025, 1, 20),
             quantity=25,
-            unit_price=350.00,
-            total_price=8750.00
+            unit_price=350.00
         ),
         PurchaseOrder(
             item_name="Monitor",
             order_date=date(2025, 1, 10),
             delivery_date=date(2025, 1, 18),
             quantity=20,
-            unit_price=450.00,
-            total_price=9000.00
+            unit_price=450.00
         ),
         PurchaseOrder(
             item_name="Keyboard",
             order_date=date(2025, 1, 12),
             delivery_date=date(2025, 1, 22),
             quantity=50,
-            unit_price=80.00,
-            total_price=4000.00
+            unit_price=80.00
         ),
         PurchaseOrder(
             item_name="Mouse",
             order_date=date(2025, 1, 12),
             delivery_date=date(2025, 1, 22),
             quantity=50,
-            unit_price=35.00,
-            total_price=1750.00
+            unit_price=35.00
         ),
     ]
 
@@ -1,32 +1,129 @@
+import logging
 import os
 
-from fastapi import FastAPI, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Body, FastAPI, Header, HTTPException, Path, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, Float, Date
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from fastapi.responses import ORJSONResponse
+from cachetools import TTLCache
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, create_engine, delete, insert, select, func, Column, Computed, Integer, String, Float, Date, DateTime, Index
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
 from pydantic import BaseModel
 from datetime import date
 from typing import List, Optional
 
+logger = logging.getLogger(__name__)
+
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432/purchase_orders")
+# The API talks to Postgres through asyncpg; DATABASE_URL stays a plain
+# psycopg2 URL for the maintenance scripts.
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+# Connection pool sizing. Each uvicorn worker owns its own pool, so the
+# DB_MAX_CONNECTIONS budget (kept below Postgres' default max_connections of
+# 100, leaving room for scripts and migrations) is split across
+# WEB_CONCURRENCY workers, capped at 20 + 10 per worker. DB_POOL_SIZE and
+# DB_MAX_OVERFLOW override the derived values.
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "90"))
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+_connections_per_worker = max(1, min(30, DB_MAX_CONNECTIONS // WEB_CONCURRENCY))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", max(1, _connections_per_worker * 2 // 3)))
+# QueuePool treats a negative max_overflow as unlimited, so never derive one
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", max(0, _connections_per_worker - DB_POOL_SIZE)))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "2000"))
+
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # Room for every statement shape the API builds so none get evicted
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    connect_args={"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}},
+)
+# Handlers open sessions with `async with AsyncSessionLocal()` only once they
+# actually need the database, so cache hits never construct one. Sessions are
+# cheap until first use and the context manager returns the connection.
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Synchronous engine used by init_db.py and the scripts in scripts/
+sync_engine = create_engine(DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 Base = declarative_base()
 
 # Database model
 class PurchaseOrder(Base):
     __tablename__ = "purchase_orders"
+    # Both list endpoints ORDER BY id and return every column, so an index on
+    # id that INCLUDEs the rest lets a page be served by an index-only scan.
+    # It replaces the plain id index, which only duplicated the primary key.
+    __table_args__ = (
+        Index(
+            "ix_purchase_orders_id_covering",
+            "id",
+            postgresql_include=[
+                "item_name", "order_date", "delivery_date",
+                "quantity", "unit_price", "total_price",
+            ],
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     item_name = Column(String, nullable=False)
     order_date = Column(Date, nullable=False)
     delivery_date = Column(Date, nullable=False)
     quantity = Column(Integer, nullable=False)
     unit_price = Column(Float, nullable=False)
-    total_price = Column(Float, nullable=False)
+    # Generated by Postgres so it can never drift from quantity * unit_price
+    total_price = Column(Float, Computed("quantity * unit_price", persisted=True), nullable=False)
+    # Versions the row for ETag revalidation on the detail endpoints
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+# Core table for the hot list queries: selecting rows as mappings skips ORM
+# instance construction and identity-map bookkeeping
+purchase_orders = PurchaseOrder.__table__
+# The columns exposed by the API (everything except bookkeeping like updated_at)
+purchase_order_columns = [
+    purchase_orders.c.id,
+    purchase_orders.c.item_name,
+    purchase_orders.c.order_date,
+    purchase_orders.c.delivery_date,
+    purchase_orders.c.quantity,
+    purchase_orders.c.unit_price,
+    purchase_orders.c.total_price,
+]
+
+# List statements are built once and parameterised with bind values, so each
+# request reuses the same statement object and its cached compiled form. The
+# list handlers encode these Core rows with orjson directly, skipping
+# response_model validation; response_model is kept for the OpenAPI schema.
+PAGE_QUERY = (
+    select(*purchase_order_columns)
+    .order_by(purchase_orders.c.id)
+    .limit(bindparam("limit", type_=Integer))
+)
+PAGE_OFFSET_QUERY = PAGE_QUERY.offset(bindparam("offset", type_=Integer))
+PAGE_AFTER_ID_QUERY = PAGE_QUERY.where(purchase_orders.c.id > bindparam("after_id"))
+# Largest value of the Integer id column; larger ids are rejected before they
+# reach asyncpg, which refuses to encode them
+MAX_ORDER_ID = 2**31 - 1
+COUNT_QUERY = select(func.count()).select_from(purchase_orders)
+# Deletes and reports whether the row existed in a single round trip
+DELETE_QUERY = (
+    delete(purchase_orders)
+    .where(purchase_orders.c.id == bindparam("order_id"))
+    .returning(purchase_orders.c.id)
+)
 
 # Pydantic models
 class PurchaseOrderBase(BaseModel):
@@ -54,16 +151,110 @@ class PaginatedPurchaseOrderResponse(BaseModel):
 # V1 Response models (simple pagination)
 class SimplePaginatedPurchaseOrderResponse(BaseModel):
     data: List[PurchaseOrderResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_more: bool = False
+    next_after_id: Optional[int] = None
+
+# Maximum number of orders accepted by one bulk create request
+BULK_CREATE_LIMIT = 1000
+
+# The model's own compiled pydantic-core validator and serializer, reused by
+# every request instead of FastAPI's per-request response_model pass. Using
+# them directly avoids compiling a second copy of the schema for an adapter.
+PURCHASE_ORDER_VALIDATOR = PurchaseOrderResponse.__pydantic_validator__
+PURCHASE_ORDER_SERIALIZER = PurchaseOrderResponse.__pydantic_serializer__
+
+def encode_purchase_order(order) -> bytes:
+    """Validate a single order and encode it to JSON in one pydantic-core pass"""
+    return PURCHASE_ORDER_SERIALIZER.to_json(PURCHASE_ORDER_VALIDATOR.validate_python(order))
+
+def render_purchase_order(order, status_code: int = 200) -> Response:
+    return Response(
+        content=encode_purchase_order(order),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+def purchase_order_etag(order) -> str:
+    return f'W/"{order.id}:{int(order.updated_at.timestamp() * 1_000_000)}"'
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): W/ prefixes are ignored on both sides"""
+    if if_none_match.strip() == "*":
+        return True
+    etag = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == etag for tag in if_none_match.split(","))
+
+# Per-worker cache of (ETag, encoded order) for repeat detail reads. Entries are
+# dropped on delete in this worker; the short TTL bounds how long another
+# worker can keep serving an order that was deleted elsewhere.
+ORDER_CACHE_TTL = int(os.getenv("ORDER_CACHE_TTL", "5"))
+order_cache = TTLCache(maxsize=10_000, ttl=ORDER_CACHE_TTL)
+# Bumped by every delete in this worker. A read that saw a different value
+# before its query may have loaded a row deleted meanwhile, so it is not cached.
+order_cache_generation = 0
+
+# Redis cache of encoded v2 list pages, shared by all workers. Disabled when
+# REDIS_URL is unset. Page keys embed a version number, so one INCR of the
+# version key on any write invalidates every cached page at once.
+REDIS_URL = os.getenv("REDIS_URL")
+PAGE_CACHE_TTL = int(os.getenv("PAGE_CACHE_TTL", "10"))
+PAGE_CACHE_VERSION_KEY = "po:v2:list:ver"
+# Short timeouts so an unreachable Redis costs a request milliseconds, not a
+# hang; every cache helper treats a timeout like any other Redis failure
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.1"))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "0.1"))
+redis_client = aioredis.from_url(
+    REDIS_URL,
+    socket_timeout=REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+) if REDIS_URL else None
+
+async def page_cache_key(cursor: Optional[int], limit: int) -> Optional[str]:
+    """Cache key for a v2 page under the current version, or None if caching is unavailable"""
+    if redis_client is None:
+        return None
+    try:
+        version = int(await redis_client.get(PAGE_CACHE_VERSION_KEY) or 0)
+    except (RedisError, TimeoutError):
+        logger.warning("Page cache unavailable", exc_info=True)
+        return None
+    return f"po:v2:list:{version}:{cursor}:{limit}"
+
+async def get_cached_page(key: str) -> Optional[bytes]:
+    try:
+        return await redis_client.get(key)
+    except (RedisError, TimeoutError):
+        logger.warning("Page cache read failed", exc_info=True)
+        return None
+
+async def set_cached_page(key: str, body: bytes):
+    try:
+        await redis_client.setex(key, PAGE_CACHE_TTL, body)
+    except (RedisError, TimeoutError):
+        logger.warning("Page cache write failed", exc_info=True)
+
+async def invalidate_page_cache():
+    if redis_client is None:
+        return
+    try:
+        await redis_client.incr(PAGE_CACHE_VERSION_KEY)
+    except (RedisError, TimeoutError):
+        # Pages written before this change still expire after PAGE_CACHE_TTL
+        logger.warning("Page cache invalidation failed", exc_info=True)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# The schema is managed by Alembic (see migrations/); run `alembic upgrade head`
+# before starting the API
 
 # FastAPI app
-app = FastAPI(title="Purchase Order API")
+app = FastAPI(title="Purchase Order API", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -74,158 +265,184 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Dependency
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # API endpoints
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Purchase Order API"}
 
+# =============================================================================
+# Shared endpoints (identical for legacy, v1 and v2)
+# =============================================================================
+
+orders_router = APIRouter()
+
+@orders_router.get("/purchase-orders/{order_id}", response_model=PurchaseOrderResponse)
+async def get_purchase_order(order_id: int = Path(..., le=MAX_ORDER_ID), if_none_match: Optional[str] = Header(None)):
+    cached = order_cache.get(order_id)
+    if cached is None:
+        generation = order_cache_generation
+        async with AsyncSessionLocal() as db:
+            order = await db.get(PurchaseOrder, order_id)
+        if not order:
+            raise HTTPException(status_code=404, detail="Purchase order not found")
+        cached = (purchase_order_etag(order), encode_purchase_order(order))
+        if generation == order_cache_generation:
+            order_cache[order_id] = cached
+    
+    etag, body = cached
+    # Clients revalidating an unchanged order get a bodyless 304
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+@orders_router.post("/purchase-orders", response_model=PurchaseOrderResponse, status_code=201)
+async def create_purchase_order(order: PurchaseOrderCreate):
+    # RETURNING hands back the id and generated total_price in the same round
+    # trip, instead of a second SELECT from refresh()
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            insert(purchase_orders).values(**order.model_dump()).returning(*purchase_order_columns)
+        )
+        db_order = result.mappings().one()
+        await db.commit()
+    await invalidate_page_cache()
+    return render_purchase_order(db_order, status_code=201)
+
+@orders_router.delete("/purchase-orders/{order_id}", status_code=204)
+async def delete_purchase_order(order_id: int = Path(..., le=MAX_ORDER_ID)):
+    global order_cache_generation
+    async with AsyncSessionLocal() as db:
+        deleted_id = await db.scalar(DELETE_QUERY, {"order_id": order_id})
+        if deleted_id is None:
+            raise HTTPException(status_code=404, detail="Purchase order not found")
+        await db.commit()
+    order_cache_generation += 1
+    order_cache.pop(order_id, None)
+    await invalidate_page_cache()
+    return None
+
 # =============================================================================
 # V1 API Endpoints (Original - Simple pagination for backward compatibility)
 # =============================================================================
 
-@app.get("/api/v1/purchase-orders", response_model=SimplePaginatedPurchaseOrderResponse)
-def get_purchase_orders_v1(
-    page: int = Query(1, ge=1, description="Page number"),
+v1_router = APIRouter()
+
+@v1_router.get("/purchase-orders", response_model=SimplePaginatedPurchaseOrderResponse)
+async def get_purchase_orders_v1(
+    page: int = Query(1, ge=1, description="Page number (ignored when after_id is given)"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+    include_total: Optional[bool] = Query(
+        None,
+        description="Include total/total_pages (runs a full COUNT); defaults to true for page-based requests and false with after_id",
+    ),
+    after_id: Optional[int] = Query(None, ge=0, le=MAX_ORDER_ID, description="Keyset cursor (last seen ID); overrides page"),
 ):
-    # Calculate offset for simple pagination
-    offset = (page - 1) * per_page
+    """
+    Soft-deprecated: prefer /api/v2/purchase-orders.
+
+    OFFSET pagination makes Postgres read and discard every skipped row, so
+    deep pages get linearly slower. Pass after_id (the previous page's
+    next_after_id) to page by keyset instead. In keyset mode page is ignored
+    and returned as null, and the COUNT is skipped unless include_total=true.
+    """
+    if include_total is None:
+        include_total = after_id is None
     
-    # Get total count
-    total = db.query(PurchaseOrder).count()
+    async with AsyncSessionLocal() as db:
+        # Fetch one extra row to detect a next page
+        if after_id is not None:
+            result = await db.execute(PAGE_AFTER_ID_QUERY, {"after_id": after_id, "limit": per_page + 1})
+        else:
+            # Calculate offset for simple pagination
+            offset = (page - 1) * per_page
+            result = await db.execute(PAGE_OFFSET_QUERY, {"offset": offset, "limit": per_page + 1})
+        orders = result.mappings().all()
+        
+        # The COUNT is a full scan, so only pay for it when the client asks
+        total = None
+        total_pages = None
+        if include_total:
+            total = await db.scalar(COUNT_QUERY)
+            total_pages = (total + per_page - 1) // per_page  # Ceiling division
     
-    # Get paginated data
-    orders = db.query(PurchaseOrder).order_by(PurchaseOrder.id).offset(offset).limit(per_page).all()
+    has_more = len(orders) > per_page
+    if has_more:
+        orders = orders[:per_page]
     
-    # Calculate pagination metadata
-    total_pages = (total + per_page - 1) // per_page  # Ceiling division
+    next_after_id = orders[-1]["id"] if orders and has_more else None
     
-    return SimplePaginatedPurchaseOrderResponse(
-        data=orders,
-        total=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages
-    )
-
-@app.get("/api/v1/purchase-orders/{order_id}", response_model=PurchaseOrderResponse)
-def get_purchase_order_v1(order_id: int, db: Session = Depends(get_db)):
-    order = db.query(PurchaseOrder).filter(PurchaseOrder.id == order_id).first()
-    if not order:
-        raise HTTPException(status_code=404, detail="Purchase order not found")
-    return order
-
-@app.post("/api/v1/purchase-orders", response_model=PurchaseOrderResponse, status_code=201)
-def create_purchase_order_v1(order: PurchaseOrderCreate, db: Session = Depends(get_db)):
-    total_price = order.quantity * order.unit_price
-    db_order = PurchaseOrder(
-        **order.model_dump(),
-        total_price=total_price
-    )
-    db.add(db_order)
-    db.commit()
-    db.refresh(db_order)
-    return db_order
-
-@app.delete("/api/v1/purchase-orders/{order_id}", status_code=204)
-def delete_purchase_order_v1(order_id: int, db: Session = Depends(get_db)):
-    order = db.query(PurchaseOrder).filter(PurchaseOrder.id == order_id).first()
-    if not order:
-        raise HTTPException(status_code=404, detail="Purchase order not found")
-    db.delete(order)
-    db.commit()
-    return None
+    return ORJSONResponse({
+        "data": [dict(order) for order in orders],
+        "total": total,
+        "page": page if after_id is None else None,
+        "per_page": per_page,
+        "total_pages": total_pages,
+        "has_more": has_more,
+        "next_after_id": next_after_id,
+    })
 
 # =============================================================================
 # V2 API Endpoints (Current - Cursor pagination)
 # =============================================================================
 
-@app.get("/api/v2/purchase-orders", response_model=PaginatedPurchaseOrderResponse)
-def get_purchase_orders_v2(
-    cursor: Optional[int] = Query(None, description="Cursor for pagination (last seen ID)"),
+v2_router = APIRouter()
+
+@v2_router.get("/purchase-orders", response_model=PaginatedPurchaseOrderResponse)
+async def get_purchase_orders_v2(
+    cursor: Optional[int] = Query(None, ge=0, le=MAX_ORDER_ID, description="Cursor for pagination (last seen ID)"),
     limit: int = Query(10, ge=1, le=100, description="Number of items per page"),
-    db: Session = Depends(get_db)
 ):
-    query = db.query(PurchaseOrder).order_by(PurchaseOrder.id)
-    
-    if cursor is not None:
-        query = query.filter(PurchaseOrder.id > cursor)
+    cache_key = await page_cache_key(cursor, limit)
+    if cache_key is not None:
+        cached = await get_cached_page(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
     
-    orders = query.limit(limit + 1).all()
+    async with AsyncSessionLocal() as db:
+        if cursor is not None:
+            result = await db.execute(PAGE_AFTER_ID_QUERY, {"after_id": cursor, "limit": limit + 1})
+        else:
+            result = await db.execute(PAGE_QUERY, {"limit": limit + 1})
+        orders = result.mappings().all()
     
     has_more = len(orders) > limit
     if has_more:
         orders = orders[:limit]
     
-    next_cursor = orders[-1].id if orders and has_more else None
+    next_cursor = orders[-1]["id"] if orders and has_more else None
     
-    return PaginatedPurchaseOrderResponse(
-        data=orders,
-        next_cursor=next_cursor,
-        has_more=has_more
-    )
+    body = orjson.dumps({
+        "data": [dict(order) for order in orders],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    })
+    if cache_key is not None:
+        await set_cached_page(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
-@app.get("/api/v2/purchase-orders/{order_id}", response_model=PurchaseOrderResponse)
-def get_purchase_order_v2(order_id: int, db: Session = Depends(get_db)):
-    order = db.query(PurchaseOrder).filter(PurchaseOrder.id == order_id).first()
-    if not order:
-        raise HTTPException(status_code=404, detail="Purchase order not found")
-    return order
-
-@app.post("/api/v2/purchase-orders", response_model=PurchaseOrderResponse, status_code=201)
-def create_purchase_order_v2(order: PurchaseOrderCreate, db: Session = Depends(get_db)):
-    total_price = order.quantity * order.unit_price
-    db_order = PurchaseOrder(
-        **order.model_dump(),
-        total_price=total_price
-    )
-    db.add(db_order)
-    db.commit()
-    db.refresh(db_order)
-    return db_order
-
-@app.delete("/api/v2/purchase-orders/{order_id}", status_code=204)
-def delete_purchase_order_v2(order_id: int, db: Session = Depends(get_db)):
-    order = db.query(PurchaseOrder).filter(PurchaseOrder.id == order_id).first()
-    if not order:
-        raise HTTPException(status_code=404, detail="Purchase order not found")
-    db.delete(order)
-    db.commit()
-    return None
+@v2_router.post("/purchase-orders:bulk", response_model=List[PurchaseOrderResponse], status_code=201)
+async def create_purchase_orders_bulk(
+    orders: List[PurchaseOrderCreate] = Body(..., min_length=1, max_length=BULK_CREATE_LIMIT),
+):
+    """Create up to BULK_CREATE_LIMIT orders in a single statement and transaction"""
+    # An executemany INSERT ... RETURNING is batched by SQLAlchemy into
+    # multi-row VALUES statements, so the whole batch shares one round trip
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            insert(purchase_orders).returning(*purchase_order_columns, sort_by_parameter_order=True),
+            [order.model_dump() for order in orders],
+        )
+        created = result.mappings().all()
+        await db.commit()
+    await invalidate_page_cache()
+    return ORJSONResponse([dict(order) for order in created], status_code=201)
 
 # =============================================================================
-# Legacy endpoints (redirect to v1 for backward compatibility)
+# Route registration (legacy /api serves v1 for backward compatibility)
 # =============================================================================
 
-@app.get("/api/purchase-orders", response_model=SimplePaginatedPurchaseOrderResponse)
-def get_purchase_orders_legacy(
-    page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
-):
-    """Legacy endpoint - redirects to v1 for backward compatibility"""
-    return get_purchase_orders_v1(page=page, per_page=per_page, db=db)
-
-@app.get("/api/purchase-orders/{order_id}", response_model=PurchaseOrderResponse)
-def get_purchase_order_legacy(order_id: int, db: Session = Depends(get_db)):
-    """Legacy endpoint - redirects to v1 for backward compatibility"""
-    return get_purchase_order_v1(order_id=order_id, db=db)
-
-@app.post("/api/purchase-orders", response_model=PurchaseOrderResponse, status_code=201)
-def create_purchase_order_legacy(order: PurchaseOrderCreate, db: Session = Depends(get_db)):
-    """Legacy endpoint - redirects to v1 for backward compatibility"""
-    return create_purchase_order_v1(order=order, db=db)
-
-@app.delete("/api/purchase-orders/{order_id}", status_code=204)
-def delete_purchase_order_legacy(order_id: int, db: Session = Depends(get_db)):
-    """Legacy endpoint - redirects to v1 for backward compatibility"""
-    return delete_purchase_order_v1(order_id=order_id, db=db)
+for prefix in ("/api", "/api/v1"):
+    app.include_router(v1_router, prefix=prefix)
+app.include_router(v2_router, prefix="/api/v2")
+for prefix in ("/api", "/api/v1", "/api/v2"):
+    app.include_router(orders_router, prefix=prefix)
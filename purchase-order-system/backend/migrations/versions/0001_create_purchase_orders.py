@@ -0,0 +1,42 @@
+"""create purchase_orders
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+Baseline schema as originally created by Base.metadata.create_all. Databases
+that were bootstrapped that way already have the table and are left as is.
+Offline (--sql) runs cannot inspect the database and always emit the DDL.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table("purchase_orders"):
+        return
+
+    op.create_table(
+        "purchase_orders",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("item_name", sa.String(), nullable=False),
+        sa.Column("order_date", sa.Date(), nullable=False),
+        sa.Column("delivery_date", sa.Date(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_price", sa.Float(), nullable=False),
+        sa.Column("total_price", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_purchase_orders_id", "purchase_orders", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("purchase_orders")
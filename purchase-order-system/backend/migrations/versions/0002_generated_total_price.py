@@ -0,0 +1,50 @@
+"""generate total_price from quantity * unit_price
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _total_price_is_generated() -> bool:
+    # Offline (--sql) runs cannot inspect the database; assume the old column
+    if context.is_offline_mode():
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns("purchase_orders")
+    return any(column["name"] == "total_price" and column.get("computed") for column in columns)
+
+
+def upgrade() -> None:
+    if _total_price_is_generated():
+        return
+
+    # Postgres cannot turn an existing column into a generated one
+    op.drop_column("purchase_orders", "total_price")
+    op.add_column(
+        "purchase_orders",
+        sa.Column(
+            "total_price",
+            sa.Float(),
+            sa.Computed("quantity * unit_price", persisted=True),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("purchase_orders", "total_price")
+    op.add_column("purchase_orders", sa.Column("total_price", sa.Float(), nullable=True))
+    op.execute("UPDATE purchase_orders SET total_price = quantity * unit_price")
+    op.alter_column("purchase_orders", "total_price", nullable=False)
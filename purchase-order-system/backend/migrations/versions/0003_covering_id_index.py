@@ -0,0 +1,59 @@
+"""replace the id index with a covering index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INCLUDE_COLUMNS = [
+    "item_name", "order_date", "delivery_date",
+    "quantity", "unit_price", "total_price",
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the index builds, but cannot
+    # run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_purchase_orders_id_covering",
+            "purchase_orders",
+            ["id"],
+            postgresql_include=INCLUDE_COLUMNS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_purchase_orders_id",
+            table_name="purchase_orders",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_purchase_orders_id",
+            "purchase_orders",
+            ["id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_purchase_orders_id_covering",
+            table_name="purchase_orders",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
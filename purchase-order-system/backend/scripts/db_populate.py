@@ -55,16 +55,12 @@ def add_entries(total_entries, batch_size=10000):
                 # Random unit price ($10-$2000)
                 unit_price = round(random.uniform(10.0, 2000.0), 2)
 
-                # Calculate total
-                total_price = round(quantity * unit_price, 2)
-
                 order = PurchaseOrder(
                     item_name=item_name,
                     order_date=order_date,
                     delivery_date=delivery_date,
                     quantity=quantity,
-                    unit_price=unit_price,
-                    total_price=total_price
+                    unit_price=unit_price
                 )
                 batch.append(order)
 